@@ -1,23 +1,48 @@
-from fastapi import FastAPI, HTTPException
+import logging
+import os
+
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from intellidoc import __version__
-from intellidoc.core import load_config, validate_config, MultiModelOrchestrator
+from intellidoc.core import validate_config, MultiModelOrchestrator
+from intellidoc.settings import get_settings
 from .routers import docs
 
+logger = logging.getLogger("intellidoc.api")
+
 # Global orchestrator instance
 orchestrator = None
 config = None
+# Serialized /health payload, rebuilt whenever the orchestrator changes
+health_json = None
+
+
+class _SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip middleware that passes selected paths (e.g. SSE streams) through uncompressed."""
+
+    def __init__(self, app, excluded_paths=(), **kwargs):
+        super().__init__(app, **kwargs)
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup application resources."""
-    global orchestrator, config
+    global orchestrator, config, health_json
     
     # Load configuration
-    config = load_config()
+    config = get_settings()
     
     if not validate_config(config):
         raise RuntimeError("Invalid configuration. Please check your API keys.")
@@ -25,13 +50,21 @@ async def lifespan(app: FastAPI):
     # Initialize orchestrator
     orchestrator = MultiModelOrchestrator(config.models, config.strategy)
     
-    print(f"Initialized IntelliDoc API v{__version__}")
-    print(f"Models: {len(config.models)}")
-    print(f"Strategy: {config.strategy.value}")
+    health_json = orjson.dumps({
+        "status": "healthy",
+        "models": len(orchestrator.providers),
+        "strategy": orchestrator.strategy.value
+    })
+    
+    logger.info(
+        "Initialized IntelliDoc API v%s (models: %d, strategy: %s)",
+        __version__, len(config.models), config.strategy.value
+    )
     
     yield
     
     # Cleanup
+    health_json = None
     orchestrator = None
     config = None
 
@@ -40,16 +73,33 @@ app = FastAPI(
     title="IntelliDoc API",
     description="Multi-Model AI Documentation Generation API",
     version=__version__,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# CORS middleware
+# CORS middleware; origins come from a comma-separated INTELLIDOC_CORS_ORIGINS
+cors_origins = [
+    origin.strip()
+    for origin in os.getenv("INTELLIDOC_CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    expose_headers=["X-Cache"],
+    max_age=86400,
+)
+
+# Compress large documentation payloads; the SSE stream is left uncompressed so
+# frames are not held in the zlib buffer until the stream closes
+app.add_middleware(
+    _SelectiveGZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    excluded_paths=[f"{docs.router.prefix}/generate/stream"],
 )
 
 # Include routers
@@ -71,14 +121,10 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    if orchestrator is None:
+    if orchestrator is None or health_json is None:
         raise HTTPException(status_code=503, detail="Service not initialized")
     
-    return {
-        "status": "healthy",
-        "models": len(orchestrator.providers),
-        "strategy": orchestrator.strategy.value
-    }
+    return Response(content=health_json, media_type="application/json")
 
 
 def get_orchestrator() -> MultiModelOrchestrator:
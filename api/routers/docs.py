@@ -1,9 +1,19 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from enum import Enum
+import email.message
+import hashlib
+import logging
 
-from intellidoc.core import DocumentationTask, detect_language, Language
+import orjson
+from cachetools import TTLCache
+
+from intellidoc.core import DocumentationTask, detect_language, Language, CollaborationStrategy
+
+logger = logging.getLogger("intellidoc.api")
 
 router = APIRouter(
     prefix="/docs",
@@ -25,8 +35,24 @@ class LanguageEnum(str, Enum):
     AUTO = "auto"
 
 
+# Content-addressed cache of generated documentation
+_result_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_CACHE_MAX_ENTRY_CHARS = 256 * 1024
+
+
+def _cache_key(code: str, context: Optional[str], language: str, doc_type: str, strategy: str) -> str:
+    """Build the result cache key for a generation request."""
+    digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16)
+    if context:
+        digest.update(b"\0")
+        digest.update(context.encode("utf-8"))
+    return f"{digest.hexdigest()}:{language}:{doc_type}:{strategy}"
+
+
 class DocGenerationRequest(BaseModel):
     """Request model for documentation generation."""
+    model_config = ConfigDict(extra="forbid")
+    
     code: str = Field(..., description="Source code to document")
     language: LanguageEnum = Field(LanguageEnum.AUTO, description="Programming language")
     filename: Optional[str] = Field(None, description="Filename (for auto language detection)")
@@ -44,19 +70,47 @@ class DocGenerationResponse(BaseModel):
     metadata: Dict[str, Any] = {}
 
 
-@router.post("/generate", response_model=DocGenerationResponse)
-async def generate_docs(request: DocGenerationRequest):
-    """
-    Generate documentation for provided code using multiple AI models.
-    
-    This endpoint uses IntelliDoc's multi-model collaboration system to produce
-    high-quality documentation by leveraging multiple AI models working together.
-    """
-    from ..app import get_orchestrator
-    
-    orchestrator = get_orchestrator()
-    
-    # Determine language
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """Whether a Content-Type header names JSON (application/json or application/*+json)."""
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    subtype = message.get_content_subtype()
+    return message.get_content_maintype() == "application" and (
+        subtype == "json" or subtype.endswith("+json")
+    )
+
+
+async def _decode_body(http_request: Request, adapter: TypeAdapter):
+    """Decode a JSON request body with orjson and validate it with a prebuilt adapter."""
+    raw = await http_request.body()
+    if not raw:
+        # Match FastAPI's error for a missing required body
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    try:
+        if _is_json_content_type(http_request.headers.get("content-type")):
+            body = orjson.loads(raw)
+        else:
+            # Like FastAPI, only JSON content types are parsed; anything else
+            # (e.g. a CORS "simple" text/plain POST) fails validation as raw bytes
+            body = raw
+        return adapter.validate_python(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error",
+              "input": {}, "ctx": {"error": e.msg}}]
+        )
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+def _resolve_language(request: DocGenerationRequest) -> Language:
+    """Determine the language of a request, raising a 400 if it cannot be resolved."""
     language = None
     if request.language != LanguageEnum.AUTO:
         try:
@@ -73,6 +127,44 @@ async def generate_docs(request: DocGenerationRequest):
             status_code=400,
             detail="Language must be specified or filename provided for auto-detection"
         )
+    return language
+
+
+def _contribution_payload(contribution) -> Dict[str, Any]:
+    """Summarize a single model contribution for API output."""
+    return {
+        "provider": contribution.provider.value,
+        "model": contribution.model,
+        "tokens": contribution.tokens_used
+    }
+
+
+def _sse_event(payload: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format a Server-Sent Events frame."""
+    data = orjson.dumps(payload).decode()
+    if event:
+        return f"event: {event}\ndata: {data}\n\n"
+    return f"data: {data}\n\n"
+
+
+async def _generate(request: DocGenerationRequest) -> Tuple[DocGenerationResponse, bool]:
+    """
+    Generate documentation for a single request, consulting the result cache first.
+    
+    Returns:
+        The generated (or cached) response and whether it was a cache hit.
+    """
+    from ..app import get_orchestrator
+    
+    orchestrator = get_orchestrator()
+    language = _resolve_language(request)
+    
+    cache_key = _cache_key(
+        request.code, request.context, language.value, request.doc_type, orchestrator.strategy.value
+    )
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        return cached, True
     
     # Create documentation task
     task = DocumentationTask(
@@ -86,31 +178,100 @@ async def generate_docs(request: DocGenerationRequest):
         # Generate documentation
         result = await orchestrator.generate_documentation(task)
         
-        return DocGenerationResponse(
+        doc_response = DocGenerationResponse(
             documentation=result.final_documentation,
             confidence_score=result.confidence_score,
             strategy_used=result.strategy_used.value,
             models_used=len(result.contributions),
             total_tokens=result.metadata.get("total_tokens", 0),
             metadata={
-                "models": [
-                    {
-                        "provider": c.provider.value,
-                        "model": c.model,
-                        "tokens": c.tokens_used
-                    }
-                    for c in result.contributions
-                ]
+                "models": [_contribution_payload(c) for c in result.contributions]
             }
         )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Documentation generation failed: {str(e)}")
+    
+    if len(doc_response.documentation) <= _CACHE_MAX_ENTRY_CHARS:
+        _result_cache[cache_key] = doc_response
+    return doc_response, False
+
+
+@router.post("/generate", response_model=DocGenerationResponse, response_class=ORJSONResponse)
+async def generate_docs(request: DocGenerationRequest, response: Response):
+    """
+    Generate documentation for provided code using multiple AI models.
+    
+    This endpoint uses IntelliDoc's multi-model collaboration system to produce
+    high-quality documentation by leveraging multiple AI models working together.
+    Identical requests are served from an in-memory cache, reported via the
+    ``X-Cache`` response header.
+    """
+    doc_response, hit = await _generate(request)
+    response.headers["X-Cache"] = "HIT" if hit else "MISS"
+    return doc_response
+
+
+@router.post("/generate/stream")
+async def generate_docs_stream(request: DocGenerationRequest):
+    """
+    Generate documentation and stream progress as Server-Sent Events.
+    
+    Emits an ``event: start`` frame immediately, then one ``data`` frame per model
+    contribution and a final ``event: done`` frame carrying the documentation,
+    aggregate confidence and whether it came from the result cache. Failures are
+    reported as an ``event: error`` frame.
+    
+    Contribution frames are sent only once the whole generation has finished, so
+    they arrive together with ``done``; only the ``start`` frame is early.
+    Results are shared with ``/generate`` through the same cache.
+    """
+    from ..app import get_orchestrator
+    
+    orchestrator = get_orchestrator()
+    # Reject unresolvable languages with a 400 before the stream starts
+    _resolve_language(request)
+    
+    async def event_stream() -> AsyncIterator[str]:
+        # Send the first bytes right away so clients see the request was accepted
+        yield _sse_event({"strategy": orchestrator.strategy.value}, event="start")
+        try:
+            doc_response, hit = await _generate(request)
+        except HTTPException as e:
+            yield _sse_event({"detail": e.detail}, event="error")
+            return
+        
+        for model_info in doc_response.metadata.get("models", []):
+            yield _sse_event(model_info)
+        
+        yield _sse_event(
+            {
+                "documentation": doc_response.documentation,
+                "confidence_score": doc_response.confidence_score,
+                "strategy_used": doc_response.strategy_used,
+                "models_used": doc_response.models_used,
+                "total_tokens": doc_response.total_tokens,
+                "cached": hit
+            },
+            event="done"
+        )
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Keep proxies and browsers from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 class BatchDocRequest(BaseModel):
     """Request for batch documentation generation."""
+    model_config = ConfigDict(extra="forbid")
+    
     files: List[DocGenerationRequest] = Field(..., description="List of files to document")
+    max_concurrency: Optional[int] = Field(
+        None, ge=1, le=64, description="Maximum number of files processed concurrently"
+    )
 
 
 class BatchDocResponse(BaseModel):
@@ -121,8 +282,38 @@ class BatchDocResponse(BaseModel):
     failed: int
 
 
-@router.post("/batch", response_model=BatchDocResponse)
-async def batch_generate(request: BatchDocRequest):
+_BATCH_ADAPTER = TypeAdapter(BatchDocRequest)
+
+
+async def parse_batch(http_request: Request) -> BatchDocRequest:
+    """Decode a batch request body."""
+    return await _decode_body(http_request, _BATCH_ADAPTER)
+
+
+def _batch_request_openapi() -> Dict[str, Any]:
+    """
+    OpenAPI ``requestBody`` for the manually decoded batch request.
+    
+    Nested models are referenced as components; /generate registers them by
+    declaring DocGenerationRequest as its body.
+    """
+    schema = BatchDocRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+    schema.pop("$defs", None)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}}
+        }
+    }
+
+
+@router.post(
+    "/batch",
+    response_model=BatchDocResponse,
+    response_class=ORJSONResponse,
+    openapi_extra=_batch_request_openapi()
+)
+async def batch_generate(request: BatchDocRequest = Depends(parse_batch)):
     """
     Generate documentation for multiple files in batch.
     
@@ -134,17 +325,32 @@ async def batch_generate(request: BatchDocRequest):
     
     orchestrator = get_orchestrator()
     
+    # Bound the number of in-flight files to stay within provider rate limits
+    max_concurrency = request.max_concurrency or getattr(orchestrator, "max_concurrency", 16)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
     async def process_one(file_request: DocGenerationRequest):
-        try:
-            return await generate_docs(file_request)
-        except Exception as e:
-            return {"error": str(e)}
+        async with semaphore:
+            doc_response, _ = await _generate(file_request)
+            return doc_response
     
-    # Process all files concurrently
-    results = await asyncio.gather(*[process_one(f) for f in request.files])
+    # Process files concurrently; a failing file must not cancel its siblings
+    results = await asyncio.gather(
+        *[process_one(f) for f in request.files],
+        return_exceptions=True
+    )
     
     # Separate successful from failed
-    successful_results = [r for r in results if not isinstance(r, dict) or "error" not in r]
+    successful_results = []
+    for file_request, result in zip(request.files, results):
+        if isinstance(result, DocGenerationResponse):
+            successful_results.append(result)
+        elif isinstance(result, HTTPException):
+            logger.warning("Batch file %s failed: %s", file_request.filename or "<unnamed>", result.detail)
+        else:
+            logger.warning(
+                "Batch file %s failed", file_request.filename or "<unnamed>", exc_info=result
+            )
     
     return BatchDocResponse(
         results=successful_results,
@@ -157,26 +363,13 @@ async def batch_generate(request: BatchDocRequest):
 @router.get("/languages")
 async def list_languages():
     """List supported programming languages."""
-    return {
-        "languages": [lang.value for lang in Language],
-        "auto_detection": True
-    }
+    return Response(content=_LANGUAGES_JSON, media_type="application/json")
 
 
 @router.get("/strategies")
 async def list_strategies():
     """List available collaboration strategies."""
-    from intellidoc.core import CollaborationStrategy
-    
-    return {
-        "strategies": [
-            {
-                "name": strategy.value,
-                "description": _get_strategy_description(strategy)
-            }
-            for strategy in CollaborationStrategy
-        ]
-    }
+    return Response(content=_STRATEGIES_JSON, media_type="application/json")
 
 
 def _get_strategy_description(strategy) -> str:
@@ -188,3 +381,19 @@ def _get_strategy_description(strategy) -> str:
         "voting": "Models generate independently, best output is selected"
     }
     return descriptions.get(strategy.value, "")
+
+
+# Static listings are serialized once at import
+_LANGUAGES_JSON = orjson.dumps({
+    "languages": [lang.value for lang in Language],
+    "auto_detection": True
+})
+_STRATEGIES_JSON = orjson.dumps({
+    "strategies": [
+        {
+            "name": strategy.value,
+            "description": _get_strategy_description(strategy)
+        }
+        for strategy in CollaborationStrategy
+    ]
+})
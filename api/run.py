@@ -0,0 +1,51 @@
+"""
+Production entrypoint for the IntelliDoc API server.
+
+Runs the FastAPI application under uvicorn with the uvloop event loop and the
+httptools HTTP parser. Usage:
+
+    python -m api.run
+
+The app is GIL-bound between awaits, so throughput scales with worker
+processes rather than threads; set INTELLIDOC_API_WORKERS to the number of
+CPU cores (the default).
+"""
+
+import copy
+import os
+import sys
+
+import uvicorn
+from uvicorn.config import LOGGING_CONFIG
+
+
+def _log_config() -> dict:
+    """uvicorn's default logging config, extended to show intellidoc.* records at INFO."""
+    config = copy.deepcopy(LOGGING_CONFIG)
+    config["loggers"]["intellidoc"] = {"handlers": ["default"], "level": "INFO", "propagate": False}
+    return config
+
+
+def main():
+    """Start the API server."""
+    host = os.getenv("INTELLIDOC_API_HOST", "0.0.0.0")
+    port = int(os.getenv("INTELLIDOC_API_PORT", "8000"))
+    workers = int(os.getenv("INTELLIDOC_API_WORKERS", str(os.cpu_count() or 1)))
+
+    # uvloop is not available on Windows; fall back to the default asyncio loop.
+    # uvicorn installs the loop itself in every worker.
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
+    uvicorn.run(
+        "api.app:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http="httptools",
+        log_config=_log_config(),
+    )
+
+
+if __name__ == "__main__":
+    main()
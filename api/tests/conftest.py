@@ -0,0 +1,66 @@
+"""
+Shared fixtures for API tests.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from intellidoc.core import CollaborationStrategy, ModelProvider
+
+
+class StubOrchestrator:
+    """Orchestrator double that records calls instead of contacting model providers."""
+
+    def __init__(self, strategy=CollaborationStrategy.CONSENSUS, delay=0.0):
+        self.strategy = strategy
+        self.providers = ["stub"]
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_documentation(self, task):
+        self.calls.append(task)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if task.code == "boom":
+                raise RuntimeError("model failure")
+            return SimpleNamespace(
+                final_documentation=f"Docs for {task.code}",
+                confidence_score=0.9,
+                strategy_used=self.strategy,
+                contributions=[
+                    SimpleNamespace(provider=ModelProvider.OPENAI, model="gpt-4", tokens_used=10),
+                    SimpleNamespace(provider=ModelProvider.ANTHROPIC, model="claude", tokens_used=12),
+                ],
+                metadata={"total_tokens": 22},
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def stub_orchestrator(monkeypatch):
+    """Install a stub orchestrator as the API's global instance."""
+    from api import app as app_module
+    from api.routers import docs
+
+    orchestrator = StubOrchestrator()
+    monkeypatch.setattr(app_module, "orchestrator", orchestrator)
+    docs._result_cache.clear()
+    yield orchestrator
+    docs._result_cache.clear()
+
+
+@pytest.fixture
+def client():
+    """Test client without running the lifespan handler (no real configuration needed)."""
+    from api.app import app
+
+    return TestClient(app)
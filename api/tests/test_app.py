@@ -0,0 +1,108 @@
+"""
+Tests for API application setup.
+"""
+
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from intellidoc.core import CollaborationStrategy
+
+
+def test_startup_is_logged(monkeypatch, caplog):
+    from api import app as app_module
+
+    config = SimpleNamespace(models=[], strategy=CollaborationStrategy.CONSENSUS)
+    monkeypatch.setattr(app_module, "get_settings", lambda: config)
+    monkeypatch.setattr(app_module, "validate_config", lambda c: True)
+
+    with caplog.at_level("INFO", logger="intellidoc.api"):
+        with TestClient(app_module.app):
+            pass
+
+    assert any("Initialized IntelliDoc API" in r.getMessage() for r in caplog.records)
+
+
+def test_run_configures_intellidoc_logging(monkeypatch):
+    from api import run
+
+    captured = {}
+    monkeypatch.setattr(run.uvicorn, "run", lambda *args, **kwargs: captured.update(kwargs))
+
+    run.main()
+
+    assert captured["log_config"]["loggers"]["intellidoc"]["level"] == "INFO"
+
+
+def test_selective_gzip_skips_excluded_paths():
+    from starlette.applications import Starlette
+    from starlette.responses import StreamingResponse
+    from starlette.routing import Route
+
+    from api.app import _SelectiveGZipMiddleware
+
+    async def chunks():
+        yield "x" * 2048
+        yield "y" * 2048
+
+    async def endpoint(request):
+        # text/plain so Starlette's own event-stream exclusion cannot mask the behavior
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    inner = Starlette(routes=[Route("/stream", endpoint), Route("/other", endpoint)])
+    client = TestClient(
+        _SelectiveGZipMiddleware(inner, minimum_size=1024, excluded_paths=["/stream"])
+    )
+    headers = {"Accept-Encoding": "gzip"}
+
+    assert "content-encoding" not in client.get("/stream", headers=headers).headers
+    assert client.get("/other", headers=headers).headers["content-encoding"] == "gzip"
+
+
+def test_health_before_startup(client):
+    response = client.get("/health")
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Service not initialized"}
+
+
+def test_health_after_startup(monkeypatch):
+    from api import app as app_module
+
+    config = SimpleNamespace(models=[], strategy=CollaborationStrategy.REVIEW)
+    monkeypatch.setattr(app_module, "get_settings", lambda: config)
+    monkeypatch.setattr(app_module, "validate_config", lambda c: True)
+
+    with TestClient(app_module.app) as client:
+        response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "healthy", "models": 0, "strategy": "review"}
+    assert app_module.health_json is None
+
+
+def test_cors_preflight_is_cached(client):
+    response = client.options(
+        "/docs/generate",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-max-age"] == "86400"
+
+
+def test_cors_unlisted_origin_not_allowed(client):
+    preflight = client.options(
+        "/docs/generate",
+        headers={"Origin": "https://evil.example", "Access-Control-Request-Method": "POST"},
+    )
+    simple = client.get("/docs/languages", headers={"Origin": "https://evil.example"})
+
+    assert "access-control-allow-origin" not in preflight.headers
+    assert "access-control-allow-origin" not in simple.headers
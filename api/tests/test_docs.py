@@ -0,0 +1,369 @@
+"""
+Tests for the documentation API routes.
+"""
+
+from api.routers import docs
+
+
+class TestListings:
+    """Test the static listing endpoints."""
+
+    def test_languages(self, client):
+        from intellidoc.core import Language
+
+        response = client.get("/docs/languages")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "languages": [lang.value for lang in Language],
+            "auto_detection": True,
+        }
+
+    def test_strategies(self, client):
+        response = client.get("/docs/strategies")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "strategies": [
+                {
+                    "name": "consensus",
+                    "description": "All models generate documentation, outputs are intelligently merged",
+                },
+                {
+                    "name": "specialization",
+                    "description": "Different models handle different aspects (overview, technical, examples)",
+                },
+                {
+                    "name": "review",
+                    "description": "Primary model generates, others review and improve",
+                },
+                {
+                    "name": "voting",
+                    "description": "Models generate independently, best output is selected",
+                },
+            ]
+        }
+
+
+class TestBatchGenerate:
+    """Test /docs/batch."""
+
+    def test_failure_does_not_cancel_siblings(self, client, stub_orchestrator):
+        files = [
+            {"code": "a = 1", "language": "python"},
+            {"code": "boom", "language": "python", "filename": "bad.py"},
+            {"code": "b = 2", "language": "python"},
+        ]
+        response = client.post("/docs/batch", json={"files": files})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_files"] == 3
+        assert body["successful"] == 2
+        assert body["failed"] == 1
+        assert [r["documentation"] for r in body["results"]] == ["Docs for a = 1", "Docs for b = 2"]
+
+    def test_failure_is_logged(self, client, stub_orchestrator, caplog):
+        files = [{"code": "boom", "language": "python", "filename": "bad.py"}]
+        with caplog.at_level("WARNING", logger="intellidoc.api"):
+            client.post("/docs/batch", json={"files": files})
+
+        assert any("bad.py" in record.getMessage() for record in caplog.records)
+
+    def test_concurrency_is_bounded(self, client, stub_orchestrator):
+        stub_orchestrator.delay = 0.01
+        files = [{"code": f"x = {i}", "language": "python"} for i in range(12)]
+
+        response = client.post("/docs/batch", json={"files": files, "max_concurrency": 3})
+
+        assert response.json()["successful"] == 12
+        assert len(stub_orchestrator.calls) == 12
+        assert stub_orchestrator.max_in_flight == 3
+
+    def test_default_concurrency(self, client, stub_orchestrator):
+        stub_orchestrator.delay = 0.01
+        files = [{"code": f"x = {i}", "language": "python"} for i in range(20)]
+
+        response = client.post("/docs/batch", json={"files": files})
+
+        assert response.json()["successful"] == 20
+        assert stub_orchestrator.max_in_flight == 16
+
+    def test_max_concurrency_range(self, client, stub_orchestrator):
+        files = [{"code": "a = 1", "language": "python"}]
+        response = client.post("/docs/batch", json={"files": files, "max_concurrency": 0})
+        assert response.status_code == 422
+
+
+class TestResultCache:
+    """Test caching of /docs/generate results."""
+
+    def test_repeat_request_hits_cache(self, client, stub_orchestrator):
+        payload = {"code": "def f(): pass", "language": "python"}
+
+        first = client.post("/docs/generate", json=payload)
+        second = client.post("/docs/generate", json=payload)
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+        assert len(stub_orchestrator.calls) == 1
+
+    def test_context_is_part_of_key(self, client, stub_orchestrator):
+        client.post("/docs/generate", json={"code": "x = 1", "language": "python", "context": "a"})
+        response = client.post(
+            "/docs/generate", json={"code": "x = 1", "language": "python", "context": "b"}
+        )
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert len(stub_orchestrator.calls) == 2
+
+    def test_strategy_is_part_of_key(self, client, stub_orchestrator):
+        from intellidoc.core import CollaborationStrategy
+
+        payload = {"code": "x = 1", "language": "python"}
+        client.post("/docs/generate", json=payload)
+        stub_orchestrator.strategy = CollaborationStrategy.VOTING
+        response = client.post("/docs/generate", json=payload)
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert len(stub_orchestrator.calls) == 2
+
+    def test_oversized_results_are_not_cached(self, client, stub_orchestrator, monkeypatch):
+        monkeypatch.setattr(docs, "_CACHE_MAX_ENTRY_CHARS", 5)
+        payload = {"code": "x = 1", "language": "python"}
+
+        client.post("/docs/generate", json=payload)
+        response = client.post("/docs/generate", json=payload)
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert len(docs._result_cache) == 0
+
+    def test_batch_shares_cache(self, client, stub_orchestrator):
+        client.post("/docs/generate", json={"code": "x = 1", "language": "python"})
+        client.post("/docs/batch", json={"files": [{"code": "x = 1", "language": "python"}]})
+
+        assert len(stub_orchestrator.calls) == 1
+
+    def test_cache_header_exposed_to_browsers(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/generate",
+            json={"code": "x = 1", "language": "python"},
+            headers={"Origin": "http://localhost:3000"},
+        )
+
+        assert "x-cache" in response.headers["access-control-expose-headers"].lower()
+
+
+def _parse_sse(text):
+    """Split an SSE body into (event, data) pairs."""
+    import json
+
+    frames = []
+    for block in text.strip().split("\n\n"):
+        event = None
+        data = None
+        for line in block.split("\n"):
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        frames.append((event, data))
+    return frames
+
+
+class TestGenerateStream:
+    """Test /docs/generate/stream."""
+
+    def test_frame_sequence(self, client, stub_orchestrator):
+        response = client.post("/docs/generate/stream", json={"code": "x = 1", "language": "python"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = _parse_sse(response.text)
+        assert [event for event, _ in frames] == ["start", None, None, "done"]
+        assert frames[0][1] == {"strategy": "consensus"}
+        assert frames[1][1] == {"provider": "openai", "model": "gpt-4", "tokens": 10}
+        assert frames[2][1] == {"provider": "anthropic", "model": "claude", "tokens": 12}
+        assert frames[3][1]["documentation"] == "Docs for x = 1"
+        assert frames[3][1]["confidence_score"] == 0.9
+        assert frames[3][1]["total_tokens"] == 22
+        assert frames[3][1]["cached"] is False
+
+    def test_proxy_buffering_disabled(self, client, stub_orchestrator):
+        response = client.post("/docs/generate/stream", json={"code": "x = 1", "language": "python"})
+
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["x-accel-buffering"] == "no"
+
+    def test_shares_result_cache(self, client, stub_orchestrator):
+        payload = {"code": "x = 1", "language": "python"}
+        client.post("/docs/generate", json=payload)
+
+        response = client.post("/docs/generate/stream", json=payload)
+
+        frames = _parse_sse(response.text)
+        assert frames[-1] == ("done", {**frames[-1][1], "cached": True})
+        assert len(stub_orchestrator.calls) == 1
+
+    def test_unresolvable_language_is_400(self, client, stub_orchestrator):
+        response = client.post("/docs/generate/stream", json={"code": "x = 1"})
+
+        assert response.status_code == 400
+
+    def test_error_frame(self, client, stub_orchestrator):
+        response = client.post("/docs/generate/stream", json={"code": "boom", "language": "python"})
+
+        frames = _parse_sse(response.text)
+        assert [event for event, _ in frames] == ["start", "error"]
+        assert "model failure" in frames[1][1]["detail"]
+
+
+class TestRequestValidation:
+    """Test strict request validation."""
+
+    def test_unknown_field_rejected(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/generate", json={"code": "x = 1", "language": "python", "colour": "blue"}
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "extra_forbidden"
+        assert stub_orchestrator.calls == []
+
+    def test_unknown_batch_field_rejected(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/batch",
+            json={"files": [{"code": "x = 1", "language": "python"}], "priority": "high"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "extra_forbidden"
+
+
+class TestCompression:
+    """Test response compression."""
+
+    def test_large_json_is_gzipped(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/generate",
+            json={"code": "x = 1\n" * 500, "language": "python"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+
+    def test_stream_is_not_gzipped(self, client, stub_orchestrator):
+        payload = {"code": "x = 1\n" * 500, "language": "python"}
+        with client.stream(
+            "POST", "/docs/generate/stream", json=payload, headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            assert "content-encoding" not in response.headers
+            first_frame = next(response.iter_lines())
+
+        assert first_frame == "event: start"
+
+
+class TestBodyDecoding:
+    """Test orjson body decoding errors match FastAPI's 422 format."""
+
+    def test_malformed_json(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/batch", content=b'{"files": [', headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["type"] == "json_invalid"
+        assert error["loc"][0] == "body"
+
+    def test_empty_body(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/batch", content=b"", headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == [
+            {"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}
+        ]
+
+    def test_nested_error_location(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/batch", json={"files": [{"code": "x = 1", "language": "cobol"}]}
+        )
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["type"] == "enum"
+        assert error["loc"] == ["body", "files", 0, "language"]
+
+    def test_non_json_content_type_rejected(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/batch",
+            content=b'{"files": [{"code": "x = 1"}]}',
+            headers={"Content-Type": "text/plain"},
+        )
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["loc"] == ["body"]
+        assert stub_orchestrator.calls == []
+
+    def test_json_suffix_content_type_accepted(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/batch",
+            content=b'{"files": [{"code": "x = 1"}]}',
+            headers={"Content-Type": "application/vnd.api+json; charset=utf-8"},
+        )
+
+        assert response.status_code == 200
+
+    def test_validation_errors_omit_url(self, client, stub_orchestrator):
+        response = client.post("/docs/batch", json={"files": [{"code": 1}]})
+
+        assert response.status_code == 422
+        assert all("url" not in error for error in response.json()["detail"])
+
+    def test_generate_malformed_json(self, client, stub_orchestrator):
+        response = client.post(
+            "/docs/generate", content=b"{", headers={"Content-Type": "application/json"}
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def _collect_refs(node):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref":
+                yield value
+            else:
+                yield from _collect_refs(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _collect_refs(item)
+
+
+class TestOpenAPI:
+    """Test the generated OpenAPI document."""
+
+    def test_batch_body_is_documented(self, client):
+        schema = client.get("/openapi.json").json()
+        components = schema["components"]["schemas"]
+
+        body = schema["paths"]["/docs/batch"]["post"]["requestBody"]
+        assert body["required"] is True
+        batch_schema = body["content"]["application/json"]["schema"]
+        item_ref = batch_schema["properties"]["files"]["items"]["$ref"]
+        assert "code" in components[item_ref.rsplit("/", 1)[1]]["properties"]
+
+    def test_all_refs_resolve(self, client):
+        schema = client.get("/openapi.json").json()
+        components = schema.get("components", {}).get("schemas", {})
+
+        for ref in _collect_refs(schema["paths"]):
+            assert ref.startswith("#/components/schemas/")
+            assert ref.rsplit("/", 1)[1] in components
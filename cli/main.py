@@ -4,17 +4,23 @@ IntelliDoc Command-Line Interface
 A powerful CLI for generating documentation using multiple AI models working in collaboration.
 """
 
+import contextlib
+import copy
+import io
+import logging
+import os
+import sys
 import typer
-from typing import Optional
+from typing import Iterator, Optional
 from pathlib import Path
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from rich import print as rprint
 import asyncio
 
 from intellidoc.core import (
-    load_config,
     create_default_config,
     validate_config,
     MultiModelOrchestrator,
@@ -23,6 +29,8 @@ from intellidoc.core import (
     detect_language,
     CollaborationStrategy
 )
+from intellidoc.fileio import read_all, read_text, write_batch
+from intellidoc.settings import get_settings
 
 app = typer.Typer(
     name="intellidoc",
@@ -30,6 +38,10 @@ app = typer.Typer(
     add_completion=False
 )
 console = Console()
+logger = logging.getLogger("intellidoc.cli")
+
+# File extensions picked up when documenting a directory
+CODE_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.java', '.cpp', '.go'})
 
 
 @app.command()
@@ -70,9 +82,10 @@ def generate(
 async def _generate_async(path: str, output: Optional[str], strategy: Optional[str], config_path: Optional[str], verbose: bool):
     """Async implementation of generate command."""
     
-    # Load configuration
-    config = load_config(config_path)
+    # Load configuration (copied, since the cached instance is shared)
+    config = copy.copy(get_settings(config_path))
     config.verbose = verbose or config.verbose
+    _configure_logging(config.verbose)
     
     # Override strategy if provided
     if strategy:
@@ -95,6 +108,7 @@ async def _generate_async(path: str, output: Optional[str], strategy: Optional[s
     
     # Initialize orchestrator
     console.print(f"[cyan]Initializing {len(config.models)} AI model(s)...[/cyan]")
+    # Built per run: its async clients are bound to this asyncio.run() event loop
     orchestrator = MultiModelOrchestrator(config.models, config.strategy)
     
     if file_path.is_file():
@@ -103,8 +117,38 @@ async def _generate_async(path: str, output: Optional[str], strategy: Optional[s
         await _generate_for_directory(file_path, orchestrator, config)
 
 
-async def _generate_for_file(file_path: Path, orchestrator: MultiModelOrchestrator, output: Optional[str], config):
-    """Generate documentation for a single file."""
+def _configure_logging(verbose: bool):
+    """Route CLI log records through the Rich console, showing debug output only when verbose."""
+    if not logger.handlers:
+        logger.addHandler(RichHandler(console=console, show_time=False, show_path=False))
+    logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
+
+
+def _progress_context():
+    """Return a Rich spinner for interactive terminals, or a no-op context in CI and quiet mode."""
+    if sys.stdout.isatty() and not os.environ.get("INTELLIDOC_QUIET"):
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        )
+    return contextlib.nullcontext()
+
+
+async def _gather_or_cancel(coros: list) -> list:
+    """Run coroutines concurrently, cancelling the rest as soon as one fails."""
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _generate_for_file(file_path: Path, orchestrator: MultiModelOrchestrator, output: Optional[str], config, code: Optional[str] = None):
+    """Generate documentation for a single file, reading it unless its contents are given."""
     
     # Detect language
     language = detect_language(file_path.name)
@@ -113,8 +157,8 @@ async def _generate_for_file(file_path: Path, orchestrator: MultiModelOrchestrat
         console.print("Generating generic documentation...")
     
     # Read file content
-    with open(file_path, 'r', encoding='utf-8') as f:
-        code = f.read()
+    if code is None:
+        code = await read_text(file_path)
     
     # Parse code if language is detected
     elements = []
@@ -122,33 +166,34 @@ async def _generate_for_file(file_path: Path, orchestrator: MultiModelOrchestrat
         parser = CodeParser(language)
         elements = parser.parse_file(code)
         
-        if config.verbose:
-            console.print(f"[dim]Found {len(elements)} code element(s)[/dim]")
+        logger.debug("Found %d code element(s)", len(elements))
     
     # Generate documentation
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task_id = progress.add_task("Generating documentation with AI models...", total=None)
+    with _progress_context() as progress:
+        if progress is not None:
+            task_id = progress.add_task("Generating documentation with AI models...", total=None)
         
         if elements:
-            # Generate documentation for each element
-            all_docs = []
-            for element in elements:
+            # Generate documentation for all elements concurrently, bounded by config
+            semaphore = asyncio.Semaphore(getattr(config, "max_concurrent", None) or 8)
+            
+            async def document_element(element):
                 doc_task = DocumentationTask(
                     code=element.code,
                     language=language.value if language else "unknown",
                     context=f"This is a {element.type} named '{element.name}'",
                     metadata={"element": element}
                 )
-                result = await orchestrator.generate_documentation(doc_task)
-                all_docs.append({
+                async with semaphore:
+                    result = await orchestrator.generate_documentation(doc_task)
+                return {
                     "element": element,
                     "documentation": result.final_documentation,
                     "confidence": result.confidence_score
-                })
+                }
+            
+            # Results keep element order; a failure cancels the remaining calls
+            all_docs = await _gather_or_cancel([document_element(e) for e in elements])
         else:
             # Generate documentation for entire file
             doc_task = DocumentationTask(
@@ -159,7 +204,8 @@ async def _generate_for_file(file_path: Path, orchestrator: MultiModelOrchestrat
             result = await orchestrator.generate_documentation(doc_task)
             all_docs = [{"documentation": result.final_documentation, "confidence": result.confidence_score}]
         
-        progress.remove_task(task_id)
+        if progress is not None:
+            progress.remove_task(task_id)
     
     # Format output
     output_content = _format_documentation(file_path, all_docs, config)
@@ -167,9 +213,7 @@ async def _generate_for_file(file_path: Path, orchestrator: MultiModelOrchestrat
     # Write output
     if output:
         output_path = Path(output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(output_content)
+        await write_batch([(output_path, output_content.encode('utf-8'))])
         console.print(f"[green]✓[/green] Documentation written to {output_path}")
     else:
         console.print("\n" + "="*80 + "\n")
@@ -186,35 +230,45 @@ async def _generate_for_directory(dir_path: Path, orchestrator: MultiModelOrches
     console.print(f"Scanning {dir_path}...")
     
     # Find all code files
-    code_files = []
-    for ext in ['.py', '.js', '.ts', '.java', '.cpp', '.go']:
-        code_files.extend(dir_path.rglob(f"*{ext}"))
+    code_files = [Path(p) for p in sorted(_iter_code_files(str(dir_path)))]
     
     console.print(f"Found {len(code_files)} code file(s)")
     
-    # Process first few files as demo
-    for file in code_files[:3]:
+    # Process first few files as demo, prefetching their contents in one go
+    selected_files = code_files[:3]
+    contents = await read_all(selected_files)
+    for file in selected_files:
         console.print(f"\n[cyan]Processing {file.name}...[/cyan]")
-        await _generate_for_file(file, orchestrator, None, config)
+        await _generate_for_file(file, orchestrator, None, config, code=contents[file])
+
+
+def _iter_code_files(directory: str) -> Iterator[str]:
+    """Recursively yield paths of code files under a directory in a single scandir pass."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_code_files(entry.path)
+            elif entry.is_file() and os.path.splitext(entry.name)[1] in CODE_EXTENSIONS:
+                yield entry.path
 
 
 def _format_documentation(file_path: Path, docs: list, config) -> str:
     """Format documentation output."""
-    lines = []
+    buf = io.StringIO()
     
-    lines.append(f"# Documentation for {file_path.name}\n")
-    lines.append(f"*Generated by IntelliDoc using {config.strategy.value} strategy*\n")
-    lines.append("---\n\n")
+    buf.write(f"# Documentation for {file_path.name}\n")
+    buf.write(f"*Generated by IntelliDoc using {config.strategy.value} strategy*\n")
+    buf.write("---\n\n")
     
     for doc_info in docs:
         if "element" in doc_info:
             element = doc_info["element"]
-            lines.append(f"## {element.type.title()}: `{element.name}`\n")
+            buf.write(f"## {element.type.title()}: `{element.name}`\n")
         
-        lines.append(doc_info["documentation"])
-        lines.append("\n\n")
+        buf.write(doc_info["documentation"])
+        buf.write("\n\n")
     
-    return "".join(lines)
+    return buf.getvalue()
 
 
 def _show_generation_summary(docs: list):
@@ -242,7 +296,7 @@ def info():
     console.print("Multi-Model AI Documentation Generator\n")
     
     # Load config to show available models
-    config = load_config()
+    config = get_settings()
     
     if config.models:
         table = Table(title="Configured AI Models")
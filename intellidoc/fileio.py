@@ -0,0 +1,62 @@
+"""
+Non-blocking file I/O helpers.
+
+Source files are read and generated documentation is written on worker
+threads so disk I/O never stalls the event loop while model calls are in flight.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+# Upper bound on concurrently outstanding reads or writes
+MAX_CONCURRENT_IO = 32
+
+
+async def read_text(path: Path, encoding: str = "utf-8") -> str:
+    """Read a text file without blocking the event loop."""
+    return await asyncio.to_thread(path.read_text, encoding=encoding)
+
+
+async def read_all(paths: Iterable[Path], encoding: str = "utf-8") -> Dict[Path, str]:
+    """
+    Read several text files concurrently.
+
+    Args:
+        paths: Files to read.
+        encoding: Text encoding of the files.
+
+    Returns:
+        Mapping of each path to its contents, in input order.
+    """
+    paths = list(paths)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_IO)
+
+    async def read_one(path: Path) -> str:
+        async with semaphore:
+            return await read_text(path, encoding)
+
+    contents = await asyncio.gather(*[read_one(p) for p in paths])
+    return dict(zip(paths, contents))
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes to a file, creating parent directories as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+async def write_batch(entries: Iterable[Tuple[Path, bytes]]) -> None:
+    """
+    Write several files concurrently.
+
+    Args:
+        entries: Pairs of destination path and file contents.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_IO)
+
+    async def write_one(path: Path, data: bytes) -> None:
+        async with semaphore:
+            await asyncio.to_thread(_write_file, path, data)
+
+    await asyncio.gather(*[write_one(path, data) for path, data in entries])
@@ -0,0 +1,28 @@
+"""
+Memoized access to IntelliDoc configuration.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from intellidoc.core import load_config
+
+
+def get_settings(config_path: Optional[str] = None):
+    """
+    Load configuration once per process and reuse it on later calls.
+
+    The returned object is shared; callers that need to override settings
+    should work on a copy.
+
+    Args:
+        config_path: Optional path to a config file, as accepted by load_config.
+    """
+    # Always pass the path positionally so get_settings() and get_settings(None)
+    # share one cache entry
+    return _load_settings(config_path)
+
+
+@lru_cache(maxsize=1)
+def _load_settings(config_path: Optional[str]):
+    return load_config(config_path)
@@ -8,7 +8,7 @@ It can be invoked manually or integrated into automated workflows.
 from __future__ import annotations
 
 import os
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 def process_single_document(file_path: str) -> None:
@@ -25,8 +25,13 @@ def process_single_document(file_path: str) -> None:
     print(f"Finished processing for {file_path}.")
 
 
-def process_all_documents_in_directory(directory: str, extensions: Iterable[str] | None = None) -> None:
-    """Process all documents in a directory with specified extensions.
+def iter_documents_in_directory(directory: str, extensions: Iterable[str] | None = None) -> Iterator[str]:
+    """Yield paths of documents in a directory with specified extensions.
+
+    A file matches when its name ends with one of the extensions, compared
+    case-insensitively.  Single-suffix extensions such as ".txt" are checked
+    with a set lookup; anything else (".tar.gz", "txt") falls back to a suffix
+    comparison.  Subdirectories are not searched.
 
     Args:
         directory: Path to a directory containing documents.
@@ -34,10 +39,33 @@ def process_all_documents_in_directory(directory: str, extensions: Iterable[str]
     """
     if extensions is None:
         extensions = {".txt"}
-    for filename in os.listdir(directory):
-        if any(filename.endswith(ext) for ext in extensions):
-            file_path = os.path.join(directory, filename)
-            process_single_document(file_path)
+    normalized = {ext.lower() for ext in extensions}
+    single_suffixes = frozenset(
+        ext for ext in normalized if ext.startswith(".") and ext.count(".") == 1
+    )
+    other_suffixes = tuple(normalized - single_suffixes)
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            name = entry.name.lower()
+            dot = name.rfind(".")
+            if (dot >= 0 and name[dot:] in single_suffixes) or (
+                other_suffixes and name.endswith(other_suffixes)
+            ):
+                yield entry.path
+
+
+def process_all_documents_in_directory(directory: str, extensions: Iterable[str] | None = None) -> None:
+    """Process all documents in a directory with specified extensions.
+
+    Args:
+        directory: Path to a directory containing documents.
+        extensions: Optional iterable of file extensions (e.g., {".txt", ".md"}).
+    """
+    for file_path in iter_documents_in_directory(directory, extensions):
+        process_single_document(file_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+"""
+Tests for CLI helpers.
+"""
+
+from cli.main import _iter_code_files
+
+
+class TestCodeFileDiscovery:
+    """Test directory scanning for code files."""
+
+    def test_finds_nested_code_files(self, tmp_path):
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "main.py").write_text("")
+        (tmp_path / "pkg" / "app.ts").write_text("")
+        (tmp_path / "pkg" / "sub" / "server.go").write_text("")
+        (tmp_path / "README.md").write_text("")
+
+        found = sorted(_iter_code_files(str(tmp_path)))
+
+        assert found == sorted([
+            str(tmp_path / "main.py"),
+            str(tmp_path / "pkg" / "app.ts"),
+            str(tmp_path / "pkg" / "sub" / "server.go"),
+        ])
+
+    def test_empty_directory(self, tmp_path):
+        assert list(_iter_code_files(str(tmp_path))) == []
+
+
+class TestGenerateRuns:
+    """Test repeated generate runs in one process."""
+
+    def test_each_run_gets_its_own_orchestrator(self, tmp_path, monkeypatch):
+        import asyncio
+        from types import SimpleNamespace
+
+        import cli.main as cli_main
+        from intellidoc.core import CollaborationStrategy
+
+        created = []
+
+        class StubOrchestrator:
+            def __init__(self, models, strategy):
+                self.loop = None
+                created.append(self)
+
+        async def fake_generate_for_file(file_path, orchestrator, output, config, code=None):
+            # Record the loop the orchestrator is used on
+            orchestrator.loop = asyncio.get_running_loop()
+
+        config = SimpleNamespace(models=[], strategy=CollaborationStrategy.CONSENSUS, verbose=False)
+        monkeypatch.setattr(cli_main, "get_settings", lambda path=None: config)
+        monkeypatch.setattr(cli_main, "validate_config", lambda c: True)
+        monkeypatch.setattr(cli_main, "MultiModelOrchestrator", StubOrchestrator)
+        monkeypatch.setattr(cli_main, "_generate_for_file", fake_generate_for_file)
+
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        for _ in range(2):
+            asyncio.run(cli_main._generate_async(str(source), None, None, None, False))
+
+        assert len(created) == 2
+        assert created[0] is not created[1]
+        assert created[0].loop is not created[1].loop
+
+
+class TestElementGeneration:
+    """Test concurrent per-element documentation in _generate_for_file."""
+
+    def _setup(self, tmp_path, monkeypatch, element_names, max_concurrent):
+        from types import SimpleNamespace
+
+        import cli.main as cli_main
+        from intellidoc.core import CollaborationStrategy
+
+        elements = [
+            SimpleNamespace(code=f"def {name}(): pass", type="function", name=name)
+            for name in element_names
+        ]
+
+        class StubParser:
+            def __init__(self, language):
+                pass
+
+            def parse_file(self, code):
+                return elements
+
+        captured = {}
+
+        def fake_format(file_path, docs, config):
+            captured["docs"] = docs
+            return ""
+
+        monkeypatch.setattr(cli_main, "CodeParser", StubParser)
+        monkeypatch.setattr(cli_main, "_format_documentation", fake_format)
+        monkeypatch.setattr(cli_main, "_show_generation_summary", lambda docs: None)
+
+        source = tmp_path / "module.py"
+        source.write_text("")
+        config = SimpleNamespace(
+            max_concurrent=max_concurrent, verbose=False, strategy=CollaborationStrategy.CONSENSUS
+        )
+        return cli_main, source, config, captured
+
+    def test_order_and_concurrency_bound(self, tmp_path, monkeypatch):
+        import asyncio
+        from types import SimpleNamespace
+
+        names = [f"f{i}" for i in range(6)]
+        cli_main, source, config, captured = self._setup(tmp_path, monkeypatch, names, 2)
+
+        class StubOrchestrator:
+            in_flight = 0
+            max_in_flight = 0
+
+            async def generate_documentation(self, task):
+                StubOrchestrator.in_flight += 1
+                StubOrchestrator.max_in_flight = max(
+                    StubOrchestrator.max_in_flight, StubOrchestrator.in_flight
+                )
+                name = task.metadata["element"].name
+                # Later elements finish first
+                await asyncio.sleep(0.01 * (len(names) - int(name[1:])))
+                StubOrchestrator.in_flight -= 1
+                return SimpleNamespace(final_documentation=f"doc {name}", confidence_score=1.0)
+
+        asyncio.run(cli_main._generate_for_file(source, StubOrchestrator(), None, config))
+
+        assert [d["documentation"] for d in captured["docs"]] == [f"doc {n}" for n in names]
+        assert StubOrchestrator.max_in_flight == 2
+
+    def test_failure_cancels_pending_calls(self, tmp_path, monkeypatch):
+        import asyncio
+
+        import pytest
+
+        cli_main, source, config, _ = self._setup(tmp_path, monkeypatch, ["bad", "a", "b"], 8)
+        cancelled = []
+
+        class StubOrchestrator:
+            async def generate_documentation(self, task):
+                name = task.metadata["element"].name
+                if name == "bad":
+                    await asyncio.sleep(0.01)
+                    raise RuntimeError("model failure")
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+
+        async def run():
+            with pytest.raises(RuntimeError):
+                await cli_main._generate_for_file(source, StubOrchestrator(), None, config)
+            # Checked before asyncio.run() teardown would cancel leftovers itself
+            return sorted(cancelled)
+
+        assert asyncio.run(run()) == ["a", "b"]
@@ -0,0 +1,39 @@
+"""
+Tests for non-blocking file I/O helpers.
+"""
+
+import pytest
+
+from intellidoc.fileio import read_all, read_text, write_batch
+
+
+@pytest.mark.asyncio
+async def test_read_text(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("def f(): pass\n", encoding="utf-8")
+    assert await read_text(path) == "def f(): pass\n"
+
+
+@pytest.mark.asyncio
+async def test_read_all_preserves_order(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"file_{i}.py"
+        path.write_text(f"x = {i}\n", encoding="utf-8")
+        paths.append(path)
+
+    contents = await read_all(paths)
+
+    assert list(contents) == paths
+    assert contents[paths[3]] == "x = 3\n"
+
+
+@pytest.mark.asyncio
+async def test_write_batch_creates_parents(tmp_path):
+    first = tmp_path / "docs" / "a.md"
+    second = tmp_path / "docs" / "nested" / "b.md"
+
+    await write_batch([(first, b"# A\n"), (second, b"# B\n")])
+
+    assert first.read_bytes() == b"# A\n"
+    assert second.read_bytes() == b"# B\n"
@@ -0,0 +1,45 @@
+"""
+Tests for the document processing script.
+"""
+
+import os
+
+from scripts.process_doc import iter_documents_in_directory
+
+
+def _names(directory, extensions=None):
+    return sorted(os.path.basename(p) for p in iter_documents_in_directory(str(directory), extensions))
+
+
+class TestIterDocuments:
+    """Test document discovery in a directory."""
+
+    def test_default_extension_is_case_insensitive(self, tmp_path):
+        for name in ("a.txt", "B.TXT", "c.md"):
+            (tmp_path / name).write_text("")
+
+        assert _names(tmp_path) == ["B.TXT", "a.txt"]
+
+    def test_subdirectories_are_not_searched(self, tmp_path):
+        (tmp_path / "top.txt").write_text("")
+        (tmp_path / "nested.txt").mkdir()
+        (tmp_path / "nested.txt" / "inner.txt").write_text("")
+
+        assert _names(tmp_path) == ["top.txt"]
+
+    def test_multi_part_and_dotless_extensions(self, tmp_path):
+        for name in ("a.tar.gz", "b.gz", "notes_txt", "c.md"):
+            (tmp_path / name).write_text("")
+
+        assert _names(tmp_path, {".tar.gz"}) == ["a.tar.gz"]
+        assert _names(tmp_path, ["txt"]) == ["notes_txt"]
+
+    def test_dotfile_matches_its_extension(self, tmp_path):
+        (tmp_path / ".txt").write_text("")
+
+        assert _names(tmp_path) == [".txt"]
+
+    def test_empty_extensions_match_nothing(self, tmp_path):
+        (tmp_path / "a.txt").write_text("")
+
+        assert _names(tmp_path, []) == []
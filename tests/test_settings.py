@@ -0,0 +1,37 @@
+"""
+Tests for memoized configuration loading.
+"""
+
+import pytest
+
+from intellidoc import settings
+
+
+@pytest.fixture
+def load_calls(monkeypatch):
+    calls = []
+
+    def fake_load_config(path=None):
+        calls.append(path)
+        return object()
+
+    monkeypatch.setattr(settings, "load_config", fake_load_config)
+    settings._load_settings.cache_clear()
+    yield calls
+    settings._load_settings.cache_clear()
+
+
+def test_call_forms_share_cache(load_calls):
+    first = settings.get_settings()
+    second = settings.get_settings(None)
+    third = settings.get_settings(config_path=None)
+
+    assert first is second is third
+    assert load_calls == [None]
+
+
+def test_explicit_path_is_loaded(load_calls):
+    settings.get_settings("custom.yml")
+    settings.get_settings("custom.yml")
+
+    assert load_calls == ["custom.yml"]